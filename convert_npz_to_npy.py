@@ -18,7 +18,7 @@ def convert_npz(input_path, output_path):
         
         if 'imdd' in f.files:
             print("  Found 'imdd' (Migrated Image). This is likely 2D.")
-            data = f['imdd']
+            data = f['imdd'].astype(np.float32, copy=False)
             print(f"  Shape: {data.shape}") # (401, 551) likely (Inline, Time)
             
             # The viewer expects 3D (Inline, Crossline, Time).
@@ -30,17 +30,15 @@ def convert_npz(input_path, output_path):
             print(f"  Extruding to 3D with {n_crosslines} crosslines...")
             
             # data is (X, Z). We want (X, Y, Z).
-            # Expand dims to (X, 1, Z) then repeat along axis 1
-            data_3d = np.expand_dims(data, axis=1)
-            data_3d = np.repeat(data_3d, n_crosslines, axis=1)
-            
-            print(f"  New shape: {data_3d.shape}")
-            data = data_3d
+            # Broadcast (X, 1, Z) along axis 1 as a zero-copy view; the
+            # repetition only materializes when written to the output file.
+            nx, nz = data.shape
+            data = np.broadcast_to(data[:, None, :], (nx, n_crosslines, nz))
 
         elif 'p' in f.files:
              # Case for Pre-stack data (Shot gathers) - fallback if needed
              print("  Found 'p' (Pre-stack). Warning: hyperbola distortion expected.")
-             data = f['p']
+             data = f['p'].astype(np.float32, copy=False)
              data = np.transpose(data, (0, 2, 1))
 
         else:
@@ -48,13 +46,14 @@ def convert_npz(input_path, output_path):
             sys.exit(1)
         print(f"  New shape: {data.shape}")
         
-        # Ensure float32
-        if data.dtype != np.float32:
-            print(f"  Converting from {data.dtype} to float32...")
-            data = data.astype(np.float32)
-            
+        # Stream the (possibly broadcast/transposed) view into a memory-mapped
+        # float32 .npy instead of building a contiguous copy in RAM first
         print(f"Saving to {output_path}...")
-        np.save(output_path, data)
+        out = np.lib.format.open_memmap(output_path, mode='w+', dtype=np.float32,
+                                        shape=data.shape)
+        np.copyto(out, data)
+        out.flush()
+        del out
         print("Done.")
             
     except Exception as e:
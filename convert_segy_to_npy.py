@@ -10,6 +10,9 @@ import argparse
 import sys
 import os
 
+# Number of traces read per bulk segyio call (bounds the temporary buffer)
+TRACES_PER_SLAB = 20_000
+
 def convert_segy(input_path, output_path):
     print(f"Opening SEG-Y file: {input_path}")
     
@@ -33,8 +36,8 @@ def convert_segy(input_path, output_path):
             min_il, max_il = np.min(ilines), np.max(ilines)
             min_xl, max_xl = np.min(xlines), np.max(xlines)
             
-            n_il = max_il - min_il + 1
-            n_xl = max_xl - min_xl + 1
+            n_il = int(max_il - min_il + 1)
+            n_xl = int(max_xl - min_xl + 1)
             n_samples = f.samples.size
             
             print(f"  Geometry detected:")
@@ -51,40 +54,43 @@ def convert_segy(input_path, output_path):
             if total_traces != expected_traces:
                 print("    Note: File is sparse or has irregular geometry. Missing traces will be zero-filled.")
             
-            # Allocate memory for the full cube
-            # Beware of RAM usage! 
-            # 4.7GB SEG-Y usually fits in 16GB RAM as float32.
+            # Memory-map the output .npy so traces stream straight to disk
+            # instead of holding the full cube in RAM.
+            # Unwritten (missing) traces read back as zeros.
             # (n_il * n_xl * n_samples * 4 bytes)
             cube_size_bytes = n_il * n_xl * n_samples * 4
-            print(f"  Allocating {cube_size_bytes / (1024**3):.2f} GB for 3D volume...")
+            print(f"  Creating {cube_size_bytes / (1024**3):.2f} GB output volume: {output_path}")
             
-            data = np.zeros((n_il, n_xl, n_samples), dtype=np.float32)
+            data = np.lib.format.open_memmap(output_path, mode='w+', dtype=np.float32,
+                                             shape=(n_il, n_xl, n_samples))
             
             print("  Reading traces...")
+
+            # Map to 0-based index
+            idx_il = ilines - min_il
+            idx_xl = xlines - min_xl
+
+            # Safety check
+            valid = (idx_il >= 0) & (idx_il < n_il) & (idx_xl >= 0) & (idx_xl < n_xl)
+
+            # Helper for progress (report roughly every 10%)
+            milestone = max(1, total_traces // 10)
             
-            # Helper for progress
-            milestone = total_traces // 10
-            
-            # Read traces and populate grid
-            for i, trace in enumerate(f.trace):
-                il = ilines[i]
-                xl = xlines[i]
-                
-                # Map to 0-based index
-                idx_il = il - min_il
-                idx_xl = xl - min_xl
-                
-                # Safety check
-                if 0 <= idx_il < n_il and 0 <= idx_xl < n_xl:
-                    data[idx_il, idx_xl, :] = trace
-                
-                if i % milestone == 0 and i > 0:
-                     print(f"    Processed {i}/{total_traces} traces ({(i/total_traces)*100:.1f}%)")
+            # Read traces in slabs and scatter them into the grid
+            for start in range(0, total_traces, TRACES_PER_SLAB):
+                stop = min(start + TRACES_PER_SLAB, total_traces)
+                traces = f.trace.raw[start:stop]
+                mask = valid[start:stop]
+                data[idx_il[start:stop][mask], idx_xl[start:stop][mask], :] = traces[mask]
+
+                if stop // milestone > start // milestone:
+                    print(f"    Processed {stop}/{total_traces} traces ({(stop/total_traces)*100:.1f}%)")
 
             print("  Reading complete.")
             
-            print(f"Saving to {output_path}...")
-            np.save(output_path, data)
+            print(f"Flushing {output_path}...")
+            data.flush()
+            del data
             print("Done.")
 
     except Exception as e:
@@ -17,14 +17,18 @@ import numpy as np
 import os
 import sys
 import argparse
+from typing import Tuple
+
+from seismic_normalize import normalize_data
+
 
 def load_npy_data(data_dir: str) -> np.ndarray:
-    """Load the seismic data from NumPy files."""
+    """Load the seismic data from NumPy files (memory-mapped, read-only)."""
     train_path = os.path.join(data_dir, 'train', 'train_seismic.npy')
     
     if os.path.exists(train_path):
         print(f"Loading: {train_path}")
-        data = np.load(train_path)
+        data = np.load(train_path, mmap_mode='r')
         print(f"Loaded shape: {data.shape}")
         return data
     
@@ -37,29 +41,11 @@ def load_npy_data(data_dir: str) -> np.ndarray:
     for path in alt_paths:
         if os.path.exists(path):
             print(f"Loading: {path}")
-            return np.load(path)
+            return np.load(path, mmap_mode='r')
     
     raise FileNotFoundError(f"Could not find seismic data in {data_dir}")
 
 
-def normalize_data(data: np.ndarray) -> np.ndarray:
-    """Normalize data to -1 to 1 range."""
-    # Use percentile clipping to handle outliers
-    p1, p99 = np.percentile(data, [1, 99])
-    data_clipped = np.clip(data, p1, p99)
-    
-    # Normalize to -1, 1
-    data_min = data_clipped.min()
-    data_max = data_clipped.max()
-    
-    if data_max - data_min > 0:
-        normalized = 2 * (data_clipped - data_min) / (data_max - data_min) - 1
-    else:
-        normalized = np.zeros_like(data_clipped)
-    
-    return normalized.astype(np.float32)
-
-
 def subsample_data(data: np.ndarray, factor: int) -> np.ndarray:
     """Subsample data by the given factor in each dimension."""
     if factor <= 1:
@@ -68,23 +54,22 @@ def subsample_data(data: np.ndarray, factor: int) -> np.ndarray:
     return data[::factor, ::factor, ::factor]
 
 
-def save_binary(data: np.ndarray, output_path: str):
-    """Save data in binary format for web loading."""
-    nx, ny, nz = data.shape
+def open_binary(output_path: str, shape: Tuple[int, int, int]) -> np.memmap:
+    """Create the web binary file and memory-map its data section for writing."""
+    nx, ny, nz = shape
+    size = nx * ny * nz
     
     print(f"Saving: {output_path}")
-    print(f"Dimensions: {nx} x {ny} x {nz} = {data.size:,} samples")
-    print(f"File size: {(12 + data.size * 4) / 1024 / 1024:.1f} MB")
+    print(f"Dimensions: {nx} x {ny} x {nz} = {size:,} samples")
+    print(f"File size: {(12 + size * 4) / 1024 / 1024:.1f} MB")
     
     with open(output_path, 'wb') as f:
         # Write header
         header = np.array([nx, ny, nz], dtype=np.int32)
         header.tofile(f)
-        
-        # Write data in inline-major order (already the default for NumPy)
-        data.tofile(f)
     
-    print("Done!")
+    # Data follows the header in inline-major order (the default for NumPy)
+    return np.memmap(output_path, dtype=np.float32, mode='r+', offset=12, shape=shape)
 
 
 def main():
@@ -113,12 +98,15 @@ def main():
     data = subsample_data(data, args.subsample)
     print(f"After subsampling ({args.subsample}x): {data.shape}")
     
-    # Normalize
-    data = normalize_data(data)
-    
-    # Save
+    # Normalize straight into the memory-mapped output file, so the
+    # normalized cube is never held in RAM as a separate copy
     os.makedirs(os.path.dirname(args.output), exist_ok=True)
-    save_binary(data, args.output)
+    output = open_binary(args.output, data.shape)
+    normalize_data(data, out=output)
+    output.flush()
+    del output
+    
+    print("Done!")
 
 
 if __name__ == '__main__':
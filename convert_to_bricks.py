@@ -7,6 +7,10 @@ This creates a directory structure with:
 - level_N/: Directories for each resolution level
   - brick_X_Y_Z.bin: Individual brick files
 
+With --format hdf5 it instead writes a single HDF5 file with one chunked
+dataset per level (chunk size == brick size) and the manifest stored as
+a JSON attribute.
+
 Usage:
     python convert_to_bricks.py --input public/data/data/train/train_seismic.npy --output public/data/bricks
 """
@@ -15,9 +19,19 @@ import numpy as np
 import os
 import json
 import argparse
-from typing import Tuple, List, Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Tuple, List, Dict, Iterator, Optional
 from dataclasses import dataclass, asdict
 
+from seismic_normalize import normalize_data
+
+
+# Concurrent brick file writes
+WRITE_THREADS = 16
+
+# Normalized [-1, 1] samples are stored as round(x * INT16_SCALE) for int16 bricks
+INT16_SCALE = 32767
+
 
 @dataclass
 class BrickInfo:
@@ -41,22 +55,6 @@ class LevelInfo:
     total_bricks: int
 
 
-def normalize_data(data: np.ndarray) -> np.ndarray:
-    """Normalize data to -1 to 1 range with percentile clipping."""
-    p1, p99 = np.percentile(data, [1, 99])
-    data_clipped = np.clip(data, p1, p99)
-    
-    data_min = data_clipped.min()
-    data_max = data_clipped.max()
-    
-    if data_max - data_min > 0:
-        normalized = 2 * (data_clipped - data_min) / (data_max - data_min) - 1
-    else:
-        normalized = np.zeros_like(data_clipped)
-    
-    return normalized.astype(np.float32)
-
-
 def downsample_volume(data: np.ndarray, factor: int) -> np.ndarray:
     """Downsample volume by averaging blocks of voxels."""
     if factor <= 1:
@@ -69,46 +67,61 @@ def downsample_volume(data: np.ndarray, factor: int) -> np.ndarray:
     nz = (nz // factor) * factor
     data = data[:nx, :ny, :nz]
     
-    # Reshape and average
-    new_shape = (nx // factor, factor, ny // factor, factor, nz // factor, factor)
-    return data.reshape(new_shape).mean(axis=(1, 3, 5)).astype(np.float32)
+    # Average by accumulating the factor^3 strided sub-grids: every input
+    # voxel is read once and the only allocation is the output accumulator
+    out = np.zeros((nx // factor, ny // factor, nz // factor), dtype=np.float32)
+    for i in range(factor):
+        for j in range(factor):
+            for k in range(factor):
+                out += data[i::factor, j::factor, k::factor]
+    out *= np.float32(1 / factor ** 3)
+    return out
 
 
-def create_bricks(
-    data: np.ndarray,
-    output_dir: str,
-    brick_size: Tuple[int, int, int] = (64, 64, 64),
-    num_levels: int = 4
-) -> Dict:
+def write_brick(filepath: str, header: np.ndarray, brick: np.ndarray,
+                compression: Optional[str] = None) -> int:
     """
-    Create bricked multi-resolution volume.
+    Write one brick file and return its size in bytes.
     
-    Args:
-        data: 3D numpy array of seismic data
-        output_dir: Directory to save bricks
-        brick_size: Size of each brick (x, y, z)
-        num_levels: Number of resolution levels
+    Layout: header (actual_size_x, actual_size_y, actual_size_z) as int32,
+    followed by the brick data, Blosc2-compressed if `compression` is set.
+    """
+    payload = brick.tobytes()
+    if compression is not None:
+        import blosc2
+        payload = blosc2.compress(payload, typesize=brick.itemsize, clevel=5,
+                                  codec=blosc2.Codec[compression.upper()])
     
-    Returns:
-        Manifest dictionary with metadata
+    with open(filepath, 'wb') as f:
+        f.write(header.tobytes())
+        f.write(payload)
+    
+    return header.nbytes + len(payload)
+
+
+def pyramid_levels(
+    data: np.ndarray,
+    brick_size: Tuple[int, int, int],
+    num_levels: int
+) -> Iterator[Tuple[int, int, np.ndarray, LevelInfo]]:
     """
-    os.makedirs(output_dir, exist_ok=True)
+    Normalize the volume and yield each level of the resolution pyramid.
     
+    Yields (level, scale_factor, level_data, level_info). Level 0 is the
+    normalized full-resolution volume; each following level halves the
+    previous one.
+    """
     # Normalize the data once at full resolution
     print("Normalizing data...")
-    data = normalize_data(data)
-    
-    original_shape = data.shape
-    levels_info: List[LevelInfo] = []
-    all_bricks: List[BrickInfo] = []
-    
-    current_data = data
+    current_data = normalize_data(data)
     
     for level in range(num_levels):
         scale_factor = 2 ** level
         
+        # Each level halves the previous one, so every pass only reads
+        # the (already reduced) level above it
         if level > 0:
-            current_data = downsample_volume(data, scale_factor)
+            current_data = downsample_volume(current_data, 2)
         
         nx, ny, nz = current_data.shape
         bx, by, bz = brick_size
@@ -118,9 +131,6 @@ def create_bricks(
         num_bricks_y = (ny + by - 1) // by
         num_bricks_z = (nz + bz - 1) // bz
         
-        level_dir = os.path.join(output_dir, f"level_{level}")
-        os.makedirs(level_dir, exist_ok=True)
-        
         level_info = LevelInfo(
             level=level,
             scale_factor=scale_factor,
@@ -129,51 +139,105 @@ def create_bricks(
             num_bricks=(num_bricks_x, num_bricks_y, num_bricks_z),
             total_bricks=num_bricks_x * num_bricks_y * num_bricks_z
         )
-        levels_info.append(level_info)
         
         print(f"\nLevel {level} (1/{scale_factor}x resolution):")
         print(f"  Dimensions: {nx} x {ny} x {nz}")
+        
+        yield level, scale_factor, current_data, level_info
+
+
+def create_bricks(
+    data: np.ndarray,
+    output_dir: str,
+    brick_size: Tuple[int, int, int] = (64, 64, 64),
+    num_levels: int = 4,
+    compression: Optional[str] = None,
+    dtype: str = 'float32'
+) -> Dict:
+    """
+    Create bricked multi-resolution volume.
+    
+    Args:
+        data: 3D numpy array of seismic data
+        output_dir: Directory to save bricks
+        brick_size: Size of each brick (x, y, z)
+        num_levels: Number of resolution levels
+        compression: Optional Blosc2 codec for brick data ('zstd' or 'lz4'),
+            requires blosc2
+        dtype: Brick sample type, 'float32' or 'int16' (quantized; the
+            manifest's scale converts back to the normalized range)
+    
+    Returns:
+        Manifest dictionary with metadata
+    """
+    if compression is not None:
+        import blosc2  # fail early if the codec library is missing
+    
+    os.makedirs(output_dir, exist_ok=True)
+    
+    original_shape = data.shape
+    levels_info: List[LevelInfo] = []
+    all_bricks: List[BrickInfo] = []
+    
+    for level, scale_factor, current_data, level_info in pyramid_levels(
+            data, brick_size, num_levels):
+        levels_info.append(level_info)
+        nx, ny, nz = level_info.dimensions
+        bx, by, bz = brick_size
+        num_bricks_x, num_bricks_y, num_bricks_z = level_info.num_bricks
+        
+        level_dir = os.path.join(output_dir, f"level_{level}")
+        os.makedirs(level_dir, exist_ok=True)
+        
         print(f"  Bricks: {num_bricks_x} x {num_bricks_y} x {num_bricks_z} = {level_info.total_bricks}")
         
-        # Create bricks for this level
+        # Quantize this level for int16 bricks (the float level is kept for
+        # downsampling the next one)
+        level_data = current_data
+        if dtype == 'int16':
+            level_data = np.rint(current_data * INT16_SCALE).astype(np.int16)
+        
+        # Pad the level to a whole number of bricks and view it as a
+        # (num_bricks_x, num_bricks_y, num_bricks_z, bx, by, bz) brick tensor
+        padded = np.pad(level_data, (
+            (0, num_bricks_x * bx - nx),
+            (0, num_bricks_y * by - ny),
+            (0, num_bricks_z * bz - nz),
+        ))
+        bricks = padded.reshape(
+            num_bricks_x, bx, num_bricks_y, by, num_bricks_z, bz
+        ).transpose(0, 2, 4, 1, 3, 5)
+        
+        # Create bricks for this level; the file writes are I/O bound and
+        # release the GIL, so they are spread over a thread pool
         brick_count = 0
-        for ix in range(num_bricks_x):
-            for iy in range(num_bricks_y):
-                for iz in range(num_bricks_z):
-                    # Calculate slice bounds
-                    x0, x1 = ix * bx, min((ix + 1) * bx, nx)
-                    y0, y1 = iy * by, min((iy + 1) * by, ny)
-                    z0, z1 = iz * bz, min((iz + 1) * bz, nz)
-                    
-                    # Extract brick data
-                    brick_data = current_data[x0:x1, y0:y1, z0:z1]
-                    
-                    # Pad to full brick size if needed
-                    if brick_data.shape != brick_size:
-                        padded = np.zeros(brick_size, dtype=np.float32)
-                        padded[:brick_data.shape[0], :brick_data.shape[1], :brick_data.shape[2]] = brick_data
-                        brick_data = padded
-                    
-                    # Save brick
-                    filename = f"brick_{ix}_{iy}_{iz}.bin"
-                    filepath = os.path.join(level_dir, filename)
-                    
-                    # Write with header: actual_size_x, actual_size_y, actual_size_z (for edge bricks)
-                    with open(filepath, 'wb') as f:
-                        header = np.array([x1 - x0, y1 - y0, z1 - z0], dtype=np.int32)
-                        header.tofile(f)
-                        brick_data.tofile(f)
-                    
-                    byte_size = os.path.getsize(filepath)
-                    
-                    brick_info = BrickInfo(
-                        level=level,
-                        x=ix, y=iy, z=iz,
-                        filename=f"level_{level}/{filename}",
-                        byte_size=byte_size
-                    )
-                    all_bricks.append(brick_info)
-                    brick_count += 1
+        with ThreadPoolExecutor(max_workers=WRITE_THREADS) as executor:
+            writes = []
+            for ix, iy, iz in np.ndindex(num_bricks_x, num_bricks_y, num_bricks_z):
+                # Actual (unpadded) extent, for edge bricks
+                header = np.array([
+                    min(bx, nx - ix * bx),
+                    min(by, ny - iy * by),
+                    min(bz, nz - iz * bz),
+                ], dtype=np.int32)
+                
+                # Save brick
+                filename = f"brick_{ix}_{iy}_{iz}.bin"
+                filepath = os.path.join(level_dir, filename)
+                write = executor.submit(write_brick, filepath, header, bricks[ix, iy, iz],
+                                        compression)
+                writes.append((ix, iy, iz, filename, write))
+            
+            # Collect file sizes (compressed bricks vary); also surfaces write errors
+            for ix, iy, iz, filename, write in writes:
+                brick_info = BrickInfo(
+                    level=level,
+                    x=ix, y=iy, z=iz,
+                    filename=f"level_{level}/{filename}",
+                    byte_size=write.result()
+                )
+                all_bricks.append(brick_info)
+                brick_count += 1
         
         print(f"  Created {brick_count} bricks")
     
@@ -185,7 +249,11 @@ def create_bricks(
         "num_levels": num_levels,
         "levels": [asdict(l) for l in levels_info],
         "bricks": [asdict(b) for b in all_bricks],
-        "total_size_bytes": sum(b.byte_size for b in all_bricks)
+        "total_size_bytes": sum(b.byte_size for b in all_bricks),
+        "compression": compression,
+        "uncompressed_brick_bytes": 12 + int(np.prod(brick_size)) * np.dtype(dtype).itemsize,
+        "dtype": dtype,
+        "scale": 1 / INT16_SCALE if dtype == 'int16' else 1.0
     }
     
     manifest_path = os.path.join(output_dir, "manifest.json")
@@ -200,34 +268,125 @@ def create_bricks(
     return manifest
 
 
+def create_hdf5(
+    data: np.ndarray,
+    output_path: str,
+    brick_size: Tuple[int, int, int] = (64, 64, 64),
+    num_levels: int = 4,
+    compression: str = 'lzf'
+) -> Dict:
+    """
+    Create the multi-resolution volume as a single chunked HDF5 file.
+    
+    Alternative to create_bricks: each level is stored as one dataset
+    ``level_N`` chunked at the brick size, so chunks correspond to bricks
+    without writing one file per brick. Requires h5py.
+    
+    Args:
+        data: 3D numpy array of seismic data
+        output_path: Path of the .h5 file to write
+        brick_size: Chunk size (x, y, z)
+        num_levels: Number of resolution levels
+        compression: h5py compression filter for the chunks
+    
+    Returns:
+        Manifest dictionary with metadata (also stored as a file attribute)
+    """
+    import h5py
+    
+    output_dir = os.path.dirname(output_path)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+    
+    original_shape = data.shape
+    levels_info: List[LevelInfo] = []
+    
+    with h5py.File(output_path, 'w') as f:
+        for level, scale_factor, current_data, level_info in pyramid_levels(
+                data, brick_size, num_levels):
+            levels_info.append(level_info)
+            nx, ny, nz = level_info.dimensions
+            bx, by, bz = brick_size
+            num_bricks_x, num_bricks_y, num_bricks_z = level_info.num_bricks
+            
+            print(f"  Chunks: {num_bricks_x} x {num_bricks_y} x {num_bricks_z} = {level_info.total_bricks}")
+            
+            # Chunks may not exceed the dataset shape
+            chunks = (min(bx, nx), min(by, ny), min(bz, nz))
+            f.create_dataset(f"level_{level}", data=current_data, chunks=chunks,
+                             compression=compression)
+        
+        manifest = {
+            "version": "1.0",
+            "original_dimensions": list(original_shape),
+            "brick_size": list(brick_size),
+            "num_levels": num_levels,
+            "levels": [asdict(l) for l in levels_info],
+            "compression": compression,
+        }
+        f.attrs["manifest"] = json.dumps(manifest)
+    
+    total_mb = os.path.getsize(output_path) / 1024 / 1024
+    print(f"\n✓ Wrote {num_levels} levels to {output_path}")
+    print(f"✓ Total size: {total_mb:.1f} MB")
+    
+    return manifest
+
+
 def main():
     parser = argparse.ArgumentParser(description='Convert seismic data to bricked format')
     parser.add_argument('--input', type=str, required=True,
                         help='Path to input .npy file')
     parser.add_argument('--output', type=str, default='public/data/bricks',
-                        help='Output directory for bricks')
+                        help='Output directory for bricks (or .h5 file for --format hdf5)')
     parser.add_argument('--brick-size', type=int, default=64,
                         help='Size of each brick in each dimension')
     parser.add_argument('--levels', type=int, default=4,
                         help='Number of resolution levels')
+    parser.add_argument('--format', choices=['bricks', 'hdf5'], default='bricks',
+                        help='One file per brick, or a single chunked HDF5 file (needs h5py)')
+    parser.add_argument('--compression', choices=['zstd', 'lz4'], default=None,
+                        help='Blosc2-compress brick data (needs blosc2; not yet read by the web viewer)')
+    parser.add_argument('--dtype', choices=['float32', 'int16'], default='float32',
+                        help='Brick sample type; int16 halves brick size')
     
     args = parser.parse_args()
     
+    # The HDF5 writer stores float32 chunks with its own (lzf) filter
+    if args.format == 'hdf5' and args.compression is not None:
+        parser.error('--compression applies to --format bricks only')
+    if args.format == 'hdf5' and args.dtype != 'float32':
+        parser.error('--dtype int16 applies to --format bricks only')
+    
     if not os.path.exists(args.input):
         print(f"Error: Input file not found: {args.input}")
         return 1
     
     print(f"Loading: {args.input}")
-    data = np.load(args.input)
+    data = np.load(args.input, mmap_mode='r')
     print(f"Loaded shape: {data.shape}")
     
     brick_size = (args.brick_size, args.brick_size, args.brick_size)
     
+    if args.format == 'hdf5':
+        output_path = args.output
+        if not output_path.endswith(('.h5', '.hdf5')):
+            output_path += '.h5'
+        create_hdf5(
+            data=data,
+            output_path=output_path,
+            brick_size=brick_size,
+            num_levels=args.levels
+        )
+        return 0
+    
     create_bricks(
         data=data,
         output_dir=args.output,
         brick_size=brick_size,
-        num_levels=args.levels
+        num_levels=args.levels,
+        compression=args.compression,
+        dtype=args.dtype
     )
     
     return 0
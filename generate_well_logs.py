@@ -8,11 +8,13 @@ Output: public/data/f3_well_logs.json
 """
 
 import json
+import zlib
 import numpy as np
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
-# Seed for reproducibility
-np.random.seed(42)
+# Seed for reproducibility (combined with a per-well hash, see generate_well_logs)
+SEED = 42
 
 # Formation-specific log properties (typical North Sea values)
 # Each entry: (GR_mean, GR_std, DT_mean, DT_std, RHOB_mean, RHOB_std)
@@ -37,6 +39,12 @@ FORMATION_PROPERTIES = {
 # Default properties for unknown formations
 DEFAULT_PROPS = (60, 18, 85, 8, 2.30, 0.08)
 
+# Property table as a (codes + 1, 6) array; the last row holds DEFAULT_PROPS
+_CODES = list(FORMATION_PROPERTIES)
+_CODE_TO_IDX = {code: i for i, code in enumerate(_CODES)}
+_PROPS = np.array([FORMATION_PROPERTIES[c] for c in _CODES] + [DEFAULT_PROPS], dtype=np.float32)
+_DEFAULT_IDX = len(_CODES)
+
 SAMPLE_INTERVAL = 0.5  # meters
 
 
@@ -49,13 +57,14 @@ def add_depth_trend(values: np.ndarray, depth_start: float, depth_end: float,
 
 
 def smooth_curve(values: np.ndarray, window: int = 5) -> np.ndarray:
-    """Apply simple moving average smoothing."""
-    kernel = np.ones(window) / window
-    smoothed = np.convolve(values, kernel, mode='same')
-    # Fix edges
+    """Apply simple moving average smoothing (odd window, edges preserved)."""
+    # Box filter from a cumulative sum: O(N) regardless of window size
     half = window // 2
-    smoothed[:half] = values[:half]
-    smoothed[-half:] = values[-half:]
+    smoothed = values.astype(np.float64)
+    if len(values) < window:
+        return smoothed
+    csum = np.concatenate(([0.0], np.cumsum(values, dtype=np.float64)))
+    smoothed[half:len(values) - half] = (csum[window:] - csum[:-window]) / window
     return smoothed
 
 
@@ -79,6 +88,9 @@ def generate_well_logs(well: dict) -> dict:
     if not formations:
         return None
 
+    # Per-well generator so results do not depend on processing order
+    rng = np.random.default_rng([SEED, zlib.crc32(well["name"].encode())])
+
     # Determine total depth range
     min_md = max(formations[0]["top_md"], 50)  # Start logs at 50m or formation top
     max_md = well["td_md"]
@@ -87,30 +99,34 @@ def generate_well_logs(well: dict) -> dict:
     depths_md = np.arange(min_md, max_md + SAMPLE_INTERVAL, SAMPLE_INTERVAL)
     n_total = len(depths_md)
 
-    # Initialize log arrays
-    gr = np.zeros(n_total)
-    dt = np.zeros(n_total)
-    rhob = np.zeros(n_total)
-
-    # Build lookup: which formation is each sample in?
-    for i, md in enumerate(depths_md):
-        fm_code = "NU"  # default to shallowest
-        for fm in formations:
-            if fm["top_md"] <= md < fm["bottom_md"]:
-                fm_code = fm["code"]
-                break
-        else:
-            # Past last formation
-            if md >= formations[-1]["bottom_md"]:
-                fm_code = formations[-1]["code"]
-
-        props = FORMATION_PROPERTIES.get(fm_code, DEFAULT_PROPS)
-        gr_mean, gr_std, dt_mean, dt_std, rhob_mean, rhob_std = props
-
-        # Generate with noise
-        gr[i] = np.random.normal(gr_mean, gr_std)
-        dt[i] = np.random.normal(dt_mean, dt_std)
-        rhob[i] = np.random.normal(rhob_mean, rhob_std)
+    # _PROPS row for each formation, plus a trailing "NU" entry used for
+    # samples that fall in a gap between formations
+    tops = np.array([fm["top_md"] for fm in formations])
+    bottoms = np.array([fm["bottom_md"] for fm in formations])
+    codes = [fm["code"] for fm in formations] + ["NU"]
+    prop_idx = np.array([_CODE_TO_IDX.get(c, _DEFAULT_IDX) for c in codes])
+
+    # Build lookup: which formation is each sample in? The first formation
+    # (in list order) with top <= md < bottom; samples past the last
+    # formation's bottom keep its code, anything else is in a gap
+    n_fm = len(formations)
+    if np.all(tops <= bottoms) and np.all(bottoms[:-1] <= tops[1:]):
+        # Sorted, non-overlapping formations: the first bottom below the
+        # sample is the only candidate
+        fi = np.minimum(np.searchsorted(bottoms, depths_md, side='right'), n_fm - 1)
+        fi[depths_md < tops[fi]] = n_fm
+    else:
+        # Overlapping or unsorted (e.g. nested NLOG units): test every formation
+        inside = (tops[:, None] <= depths_md) & (depths_md < bottoms[:, None])
+        fi = np.where(inside.any(axis=0), inside.argmax(axis=0), n_fm)
+        fi[(fi == n_fm) & (depths_md >= bottoms[-1])] = n_fm - 1
+
+    # Generate with noise (one draw for all three curves)
+    props = _PROPS[prop_idx[fi]]
+    noise = rng.standard_normal((3, n_total))
+    gr = props[:, 0] + props[:, 1] * noise[0]
+    dt = props[:, 2] + props[:, 3] * noise[1]
+    rhob = props[:, 4] + props[:, 5] * noise[2]
 
     # Add compaction trends
     gr = add_depth_trend(gr, min_md, max_md, -5)   # GR slightly decreases with depth
@@ -123,15 +139,23 @@ def generate_well_logs(well: dict) -> dict:
     rhob = smooth_curve(rhob, window=5)
 
     # Add subtle boundary effects at formation tops
+    boundaries = []
     for fm in formations:
         idx = np.argmin(np.abs(depths_md - fm["top_md"]))
         boundary_width = min(20, n_total - idx)  # ~10m transition
         if idx > 0 and idx < n_total - boundary_width:
-            # Add a spike pattern near boundaries (common in real logs)
-            spike = np.random.normal(0, 3, boundary_width)
-            gr[idx:idx+boundary_width] += spike * 2
-            dt[idx:idx+boundary_width] += spike
-            rhob[idx:idx+boundary_width] -= spike * 0.02
+            boundaries.append((idx, boundary_width))
+
+    # Add a spike pattern near boundaries (common in real logs),
+    # drawing the noise for every boundary at once
+    spikes = 3 * rng.standard_normal(sum(width for _, width in boundaries))
+    start = 0
+    for idx, boundary_width in boundaries:
+        spike = spikes[start:start+boundary_width]
+        start += boundary_width
+        gr[idx:idx+boundary_width] += spike * 2
+        dt[idx:idx+boundary_width] += spike
+        rhob[idx:idx+boundary_width] -= spike * 0.02
 
     # Final smoothing pass
     gr = smooth_curve(gr, window=3)
@@ -161,14 +185,14 @@ def generate_well_logs(well: dict) -> dict:
     return {
         "wellName": well["name"],
         "depthUnit": "m",
-        "depths": [round(float(d), 1) for d in depths_md],
-        "tvdss": [round(float(d), 1) for d in depths_tvdss],
+        "depths": np.round(depths_md, 1).tolist(),
+        "tvdss": np.round(depths_tvdss, 1).tolist(),
         "curves": [
             {
                 "name": "GR",
                 "unit": "gAPI",
                 "description": "Gamma Ray",
-                "data": [round(float(v), 1) for v in gr],
+                "data": np.round(gr, 1).tolist(),
                 "min": round(float(np.min(gr)), 1),
                 "max": round(float(np.max(gr)), 1),
             },
@@ -176,7 +200,7 @@ def generate_well_logs(well: dict) -> dict:
                 "name": "DT",
                 "unit": "us/ft",
                 "description": "Sonic",
-                "data": [round(float(v), 1) for v in dt],
+                "data": np.round(dt, 1).tolist(),
                 "min": round(float(np.min(dt)), 1),
                 "max": round(float(np.max(dt)), 1),
             },
@@ -184,7 +208,7 @@ def generate_well_logs(well: dict) -> dict:
                 "name": "RHOB",
                 "unit": "g/cc",
                 "description": "Bulk Density",
-                "data": [round(float(v), 2) for v in rhob],
+                "data": np.round(rhob, 2).tolist(),
                 "min": round(float(np.min(rhob)), 2),
                 "max": round(float(np.max(rhob)), 2),
             },
@@ -198,10 +222,14 @@ def main():
     with open(wells_path) as f:
         well_dataset = json.load(f)
 
+    # Wells are independent, so generate them in parallel
+    wells = well_dataset["wells"]
+    with ProcessPoolExecutor() as executor:
+        results = list(executor.map(generate_well_logs, wells))
+
     logs = []
-    for well in well_dataset["wells"]:
-        print(f"Generating logs for {well['name']}...")
-        log_data = generate_well_logs(well)
+    for well, log_data in zip(wells, results):
+        print(f"Generated logs for {well['name']}")
         if log_data:
             n_samples = len(log_data["depths"])
             depth_range = f"{log_data['depths'][0]}-{log_data['depths'][-1]}m"
@@ -7,22 +7,41 @@ Usage:
     python process_f3_wells.py
 
 Expects NLOG data at /tmp/f3_nlog/ (downloaded from nlog.nl thematic datasets).
+Requires numpy and pandas (pyarrow enables a Parquet cache of the parsed
+CSVs, and orjson is used to write the output, when installed).
 Output: public/data/f3_wells.json
 """
 
-import csv
+import io
 import json
+import mmap
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 # NLOG data paths
 NLOG_DIR = "/tmp/f3_nlog"
 DEV_FILE = os.path.join(NLOG_DIR, "nlog_dirstelsel_20260205.csv")
 STRAT_FILE = os.path.join(NLOG_DIR, "nlog_stratstelsel_20260205.csv")
 
+# Rows per chunk when streaming the NLOG CSVs (bounds parser memory)
+NLOG_CHUNK_ROWS = 1_000_000
+
+# Bytes scanned per block when indexing the NLOG CSVs by wellbore
+INDEX_BLOCK_BYTES = 1 << 24
+
+# Bumped whenever the wellbore index layout or scanning rules change, so
+# indexes cached next to the CSVs by older versions are rebuilt
+WELLBORE_INDEX_VERSION = 2
+
 # Output
 OUTPUT_FILE = "public/data/f3_wells.json"
 
+# Per-well trajectory layout (one structured array per well, converted to
+# dicts only when the JSON is written). float64 so the rounded values are
+# written without float32 representation noise.
+TRAJECTORY_DTYPE = [('md', 'f8'), ('tvdss', 'f8'), ('il', 'f8'), ('xl', 'f8')]
+
 # F3 wells of interest (NLOG naming format)
 WELLS = {
     "F02-01": {"display_name": "F02-1", "color": "#ff6b6b"},
@@ -110,16 +129,15 @@ def compute_grid_transform():
     # X = Ox + IL*a + XL*c
     # Y = Oy + IL*b + XL*d
     # Set up: [1, IL, XL] * [Ox, a, c]^T = X
-    A = np.array([[1, il, xl] for il, xl, x, y in wells_known])
-    X = np.array([x for il, xl, x, y in wells_known])
-    Y = np.array([y for il, xl, x, y in wells_known])
+    known = np.array(wells_known, dtype=np.float64)
+    IL, XL = known[:, 0], known[:, 1]
+    A = np.column_stack([np.ones_like(IL), IL, XL])
     
-    # Least squares solve
-    x_coeffs, _, _, _ = np.linalg.lstsq(A, X, rcond=None)
-    y_coeffs, _, _, _ = np.linalg.lstsq(A, Y, rcond=None)
+    # Least squares solve for X and Y together (one factorization of A)
+    coeffs, _, _, _ = np.linalg.lstsq(A, known[:, 2:], rcond=None)
     
-    Ox, a, c = x_coeffs
-    Oy, b, d = y_coeffs
+    Ox, a, c = coeffs[:, 0]
+    Oy, b, d = coeffs[:, 1]
     
     print(f"Grid transform (UTM = Origin + IL*vec_il + XL*vec_xl):")
     print(f"  Origin: ({Ox:.1f}, {Oy:.1f})")
@@ -136,87 +154,280 @@ def compute_grid_transform():
     return Ox, Oy, a, b, c, d
 
 
-def utm_to_ilxl(x, y, Ox, Oy, a, b, c, d):
-    """Convert UTM coordinates back to IL/XL using the inverse transform."""
+def utm_to_ilxl_batch(xy, origin, M_inv):
+    """Convert UTM coordinates (shape (N, 2) or (2,)) to IL/XL of the same shape.
+    
+    origin is [Ox, Oy] and M_inv the inverse of the [[a, c], [b, d]] grid
+    matrix, both computed once.
+    """
     import numpy as np
     
-    # [a, c] [IL]   [X - Ox]
-    # [b, d] [XL] = [Y - Oy]
-    M = np.array([[a, c], [b, d]])
-    rhs = np.array([x - Ox, y - Oy])
-    ilxl = np.linalg.solve(M, rhs)
-    return ilxl[0], ilxl[1]
+    return (np.asarray(xy) - origin) @ M_inv.T
 
 
-def parse_deviation_csv(filepath, well_names):
-    """Parse NLOG deviation survey CSV and extract data for specified wells."""
-    wells_dev = {name: [] for name in well_names}
+def scan_record_runs(data, start):
+    """Find where the first field of the CSV records in data[start:] changes.
     
-    with open(filepath, 'r') as f:
-        reader = csv.reader(f, delimiter=';')
-        header = next(reader)
+    data is the raw file as a uint8 array. Lines are processed a block at a
+    time with NumPy (newline/separator/quote search, first-field comparison),
+    so Python only runs once per change of value rather than once per row.
+    Quote parity is tracked across the file: a line starts a record only if
+    it begins outside quotes and has a separator outside quotes, so lines
+    continuing a multi-line quoted field never do. Returns the byte offset
+    and first-field bytes (without enclosing quotes) of each run.
+    """
+    import numpy as np
+    
+    run_starts, run_fields = [], []
+    previous = None
+    size = len(data)
+    quotes_before = int(np.count_nonzero(data[:start] == ord('"')))
+    block_bytes = INDEX_BLOCK_BYTES
+    while start < size:
+        stop = min(start + block_bytes, size)
+        line_ends = np.flatnonzero(data[start:stop] == ord('\n')) + start + 1
+        if stop < size:
+            if len(line_ends) == 0:
+                block_bytes *= 2  # Line longer than a block
+                continue
+            stop = int(line_ends[-1])
+        elif len(line_ends) == 0 or line_ends[-1] != size:
+            line_ends = np.append(line_ends, size)
+        block_bytes = INDEX_BLOCK_BYTES
+        
+        # A position is outside quotes when an even number of quote
+        # characters precede it (escaped "" quotes count twice)
+        block = data[start:stop]
+        quotes = np.flatnonzero(block == ord('"')) + start
+        line_starts = np.concatenate(([start], line_ends[:-1]))
+        separators = np.flatnonzero(block == ord(';')) + start
+        separators = separators[(np.searchsorted(quotes, separators) + quotes_before) % 2 == 0]
+        
+        # First unquoted separator of each line (sentinel past the block if none)
+        separators = np.append(separators, stop)
+        field_ends = separators[np.searchsorted(separators, line_starts)]
+        is_record = ((field_ends < line_ends)
+                     & ((np.searchsorted(quotes, line_starts) + quotes_before) % 2 == 0))
+        quotes_before += len(quotes)
+        
+        record_starts = line_starts[is_record]
+        field_ends = field_ends[is_record]
+        start = stop
+        if len(record_starts) == 0:
+            continue
+        
+        # Drop the quotes around quoted fields
+        quoted = ((field_ends - record_starts > 1)
+                  & (data[record_starts] == ord('"'))
+                  & (data[field_ends - 1] == ord('"')))
+        field_starts = record_starts + quoted
+        field_ends = field_ends - quoted
         
-        # Find column indices
-        cols = {h.strip('"'): i for i, h in enumerate(header)}
+        # Compare each record's first field with the one before it
+        lengths = field_ends - field_starts
+        cols = np.arange(lengths.max())
+        fields = np.where(cols < lengths[:, None],
+                          data[np.minimum(field_starts[:, None] + cols, size - 1)], 0)
+        changed = np.ones(len(record_starts), dtype=bool)
+        changed[1:] = (lengths[1:] != lengths[:-1]) | (fields[1:] != fields[:-1]).any(axis=1)
         
-        for row in reader:
-            wellbore = row[cols['WELLBORE']].strip('"')
-            if wellbore in well_names:
-                try:
-                    ah_depth = float(row[cols['AH_DEPTH']])
-                    tv_depth_nap = float(row[cols['TV_DEPTH_NAP']])
-                    x_surface = float(row[cols['X_SURFACE_UTM31_ED50']])
-                    y_surface = float(row[cols['Y_SURFACE_UTM31_ED50']])
-                    dx = float(row[cols['DX_UTM31_ED50']])
-                    dy = float(row[cols['DY_UTM31_ED50']])
-                    
-                    wells_dev[wellbore].append({
-                        'ah_depth': ah_depth,
-                        'tvdss': tv_depth_nap,
-                        'x': x_surface + dx,
-                        'y': y_surface + dy,
-                        'x_surface': x_surface,
-                        'y_surface': y_surface,
-                    })
-                except (ValueError, KeyError) as e:
-                    continue
+        for i in np.flatnonzero(changed):
+            field = data[field_starts[i]:field_ends[i]].tobytes()
+            if field != previous:
+                run_starts.append(int(record_starts[i]))
+                run_fields.append(field)
+                previous = field
+    
+    return run_starts, run_fields
+
+
+def load_wellbore_index(filepath):
+    """Map each WELLBORE to the byte ranges of its rows in an NLOG CSV.
+    
+    NLOG exports are grouped by wellbore, so a few wells can be read from a
+    few byte slices instead of parsing the whole file. The index is cached
+    next to the CSV and rebuilt when the CSV's size or mtime changes.
+    Returns None if WELLBORE is not the first column.
+    """
+    import numpy as np
+    
+    stat = os.stat(filepath)
+    index_path = filepath + '.wellbore_index.json'
+    if os.path.exists(index_path):
+        with open(index_path) as f:
+            index = json.load(f)
+        if (index.get('version') == WELLBORE_INDEX_VERSION
+                and index['mtime'] == stat.st_mtime and index['size'] == stat.st_size):
+            return index
+    
+    with open(filepath, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        header_size = mm.find(b'\n') + 1 or len(mm)
+        first_field = mm[:header_size].split(b';', 1)[0].strip().lstrip(b'\xef\xbb\xbf')
+        if first_field.strip(b'"') != b'WELLBORE':
+            return None
+        
+        data = np.frombuffer(mm, dtype=np.uint8)
+        run_starts, run_fields = scan_record_runs(data, header_size)
+        del data  # release the buffer before the mmap is closed
+    
+    ranges = {}
+    run_ends = run_starts[1:] + [stat.st_size]
+    for field, run_start, run_end in zip(run_fields, run_starts, run_ends):
+        ranges.setdefault(field.decode(), []).append([run_start, run_end])
+    
+    index = {
+        'version': WELLBORE_INDEX_VERSION,
+        'mtime': stat.st_mtime,
+        'size': stat.st_size,
+        'header_size': header_size,
+        'ranges': ranges,
+    }
+    try:
+        with open(index_path, 'w') as f:
+            json.dump(index, f)
+    except OSError:
+        pass  # Read-only location; the index is rebuilt next run
+    
+    return index
+
+
+def read_wellbore_rows(filepath, index, well_names):
+    """Return the CSV header plus only the byte ranges of the given wells."""
+    spans = sorted(span for name in well_names for span in index['ranges'].get(name, []))
+    with open(filepath, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        parts = [mm[:index['header_size']]] + [mm[start:end] for start, end in spans]
+    return io.BytesIO(b''.join(parts))
+
+
+def read_nlog_rows(source, well_names, columns, dtype, numeric_fields):
+    """Stream an NLOG CSV (path or file object), keeping rows of the given wells."""
+    import pandas as pd
+    
+    # Read in chunks so only the matching rows are ever kept
+    reader = pd.read_csv(source, sep=';', quotechar='"', engine='c',
+                         usecols=columns, dtype=dtype,
+                         keep_default_na=False,
+                         na_values={field: [''] for field in numeric_fields},
+                         chunksize=NLOG_CHUNK_ROWS)
+    with reader:
+        return pd.concat([chunk[chunk['WELLBORE'].isin(well_names)] for chunk in reader])
+
+
+def read_nlog_csv(filepath, well_names, numeric_fields, string_fields):
+    """Read selected columns of an NLOG CSV, keeping rows for the given wells.
+    
+    Rows with missing or unparseable numeric fields are dropped. The result
+    is cached as Parquet under .cache/ next to the CSV and reused while the
+    CSV's size and mtime, the wells and the columns are unchanged.
+    """
+    import pandas as pd
+    
+    well_names = frozenset(well_names)
+    columns = ['WELLBORE'] + numeric_fields + string_fields
+    dtype = {field: str for field in ['WELLBORE'] + string_fields}
+    
+    stat = os.stat(filepath)
+    cache_dir = os.path.join(os.path.dirname(filepath), '.cache')
+    cache_path = os.path.join(cache_dir, os.path.basename(filepath) + '.parquet')
+    cache_key = {
+        'mtime': stat.st_mtime,
+        'size': stat.st_size,
+        'wells': sorted(well_names),
+        'columns': columns,
+    }
+    try:
+        with open(cache_path + '.json') as f:
+            if json.load(f) == cache_key:
+                return pd.read_parquet(cache_path)
+    except (OSError, ValueError, ImportError):
+        pass  # No usable cache; parse the CSV
+    
+    # Only read the byte ranges holding the requested wells when the index
+    # covers all of them, and only trust the result if it parses cleanly
+    # and contains every well; otherwise parse the whole file
+    df = None
+    index = load_wellbore_index(filepath)
+    if index is not None and well_names <= index['ranges'].keys():
+        try:
+            df = read_nlog_rows(read_wellbore_rows(filepath, index, well_names),
+                                well_names, columns, dtype, numeric_fields)
+        except pd.errors.ParserError:
+            pass  # A byte range cut through a record
+        if df is not None and not well_names <= set(df['WELLBORE']):
+            df = None
+    if df is None:
+        df = read_nlog_rows(filepath, well_names, columns, dtype, numeric_fields)
+    
+    df[numeric_fields] = df[numeric_fields].apply(pd.to_numeric, errors='coerce')
+    df = df.dropna(subset=numeric_fields)
+    
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        df.to_parquet(cache_path)
+        with open(cache_path + '.json', 'w') as f:
+            json.dump(cache_key, f)
+    except (OSError, ImportError):
+        pass  # Read-only location or no Parquet engine; parse again next run
+    
+    return df
+
+
+def records_by_well(records, wellbores, well_names):
+    """Split a DataFrame into per-well lists of record dicts, in file order."""
+    wells = {name: [] for name in well_names}
+    for wellbore, group in records.groupby(wellbores, sort=False):
+        wells[wellbore] = group.to_dict('records')
+    return wells
+
+
+def parse_deviation_csv(filepath, well_names):
+    """Parse NLOG deviation survey CSV and extract data for specified wells."""
+    import pandas as pd
+    
+    df = read_nlog_csv(filepath, well_names,
+                       ['AH_DEPTH', 'TV_DEPTH_NAP', 'X_SURFACE_UTM31_ED50',
+                        'Y_SURFACE_UTM31_ED50', 'DX_UTM31_ED50', 'DY_UTM31_ED50'],
+                       [])
     
+    dev = pd.DataFrame({
+        'ah_depth': df['AH_DEPTH'],
+        'tvdss': df['TV_DEPTH_NAP'],
+        'x': df['X_SURFACE_UTM31_ED50'] + df['DX_UTM31_ED50'],
+        'y': df['Y_SURFACE_UTM31_ED50'] + df['DY_UTM31_ED50'],
+        'x_surface': df['X_SURFACE_UTM31_ED50'],
+        'y_surface': df['Y_SURFACE_UTM31_ED50'],
+    })
+    
+    # One record array per well (fields ah_depth, tvdss, x, y, x_surface,
+    # y_surface) instead of a dict per survey point
+    wells_dev = {name: dev.iloc[:0].to_records(index=False) for name in well_names}
+    for wellbore, group in dev.groupby(df['WELLBORE'], sort=False):
+        wells_dev[wellbore] = group.to_records(index=False)
     return wells_dev
 
 
 def parse_strat_csv(filepath, well_names):
     """Parse NLOG stratigraphy CSV and extract formation tops for specified wells."""
-    wells_strat = {name: [] for name in well_names}
+    import pandas as pd
     
-    with open(filepath, 'r') as f:
-        reader = csv.reader(f, delimiter=';')
-        header = next(reader)
-        
-        cols = {h.strip('"'): i for i, h in enumerate(header)}
-        
-        for row in reader:
-            wellbore = row[cols['WELLBORE']].strip('"')
-            if wellbore in well_names:
-                try:
-                    top_ah = float(row[cols['TOP_AH']])
-                    bottom_ah = float(row[cols['BOTTOM_AH']])
-                    tv_top = float(row[cols['TV_TOP_NAP']])
-                    tv_bottom = float(row[cols['TV_BOTTOM_NAP']])
-                    strat_code = row[cols['STRAT_UNIT_CD']].strip('"')
-                    strat_name = row[cols['STRAT_UNIT_NM']].strip('"')
-                    
-                    wells_strat[wellbore].append({
-                        'top_md': top_ah,
-                        'bottom_md': bottom_ah,
-                        'top_tvdss': tv_top,
-                        'bottom_tvdss': tv_bottom,
-                        'code': strat_code,
-                        'name': strat_name,
-                    })
-                except (ValueError, KeyError) as e:
-                    continue
-    
-    return wells_strat
+    df = read_nlog_csv(filepath, well_names,
+                       ['TOP_AH', 'BOTTOM_AH', 'TV_TOP_NAP', 'TV_BOTTOM_NAP'],
+                       ['STRAT_UNIT_CD', 'STRAT_UNIT_NM'])
+    
+    # Columns in the order they are written to the output JSON
+    strat = pd.DataFrame({
+        'name': df['STRAT_UNIT_NM'],
+        'code': df['STRAT_UNIT_CD'],
+        'top_md': df['TOP_AH'],
+        'top_tvdss': df['TV_TOP_NAP'],
+        'bottom_md': df['BOTTOM_AH'],
+        'bottom_tvdss': df['TV_BOTTOM_NAP'],
+        'color': df['STRAT_UNIT_CD'].map(FORMATION_COLORS).fillna('#999999'),
+    })
+    # Round whole columns here rather than per formation in main()
+    strat = strat.round({'top_md': 1, 'bottom_md': 1, 'top_tvdss': 1, 'bottom_tvdss': 1})
+    
+    return records_by_well(strat, df['WELLBORE'], well_names)
 
 
 # Formation color mapping for common formations
@@ -250,6 +461,25 @@ FORMATION_COLORS = {
 }
 
 
+def trajectory_to_json(traj):
+    """Convert a TRAJECTORY_DTYPE array to the list of point dicts written to JSON."""
+    names = traj.dtype.names
+    return [dict(zip(names, pt)) for pt in traj.tolist()]
+
+
+def write_json(obj, path):
+    """Write obj as JSON indented by two spaces, with orjson when available."""
+    try:
+        import orjson
+    except ImportError:
+        with open(path, 'w') as f:
+            json.dump(obj, f, indent=2)
+        return
+    
+    with open(path, 'wb') as f:
+        f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+
+
 def main():
     import numpy as np
     
@@ -257,12 +487,28 @@ def main():
     
     print("Computing survey grid transform from known well positions...")
     Ox, Oy, a, b, c, d = compute_grid_transform()
+    # Closed-form inverse of the 2x2 grid matrix [[a, c], [b, d]], shared
+    # by the surface and trajectory transforms of every well
+    det = a * d - b * c
+    M_inv = np.array([[d, -c], [-b, a]]) / det
+    origin = np.array([Ox, Oy])
     
+    # The two CSVs are independent; parse them in parallel threads (the
+    # pandas parser and file reads release the GIL)
     print(f"\nParsing deviation surveys from {DEV_FILE}...")
-    wells_dev = parse_deviation_csv(DEV_FILE, well_names)
-    
     print(f"Parsing stratigraphy from {STRAT_FILE}...")
-    wells_strat = parse_strat_csv(STRAT_FILE, well_names)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        dev_future = executor.submit(parse_deviation_csv, DEV_FILE, well_names)
+        strat_future = executor.submit(parse_strat_csv, STRAT_FILE, well_names)
+        wells_dev = dev_future.result()
+        wells_strat = strat_future.result()
+    
+    # IL/XL of every well's survey points in one batched transform, split
+    # back per well afterwards
+    all_dev = np.concatenate([wells_dev[name] for name in well_names])
+    all_ilxl = utm_to_ilxl_batch(np.column_stack([all_dev['x'], all_dev['y']]), origin, M_inv)
+    well_ends = np.cumsum([len(wells_dev[name]) for name in well_names])
+    wells_ilxl = dict(zip(well_names, np.split(all_ilxl, well_ends[:-1])))
     
     # Build output JSON
     output = {
@@ -288,44 +534,30 @@ def main():
         dev_data = wells_dev.get(nlog_name, [])
         strat_data = wells_strat.get(nlog_name, [])
         
-        if not dev_data:
+        if len(dev_data) == 0:
             print(f"  WARNING: No deviation data for {nlog_name}")
             continue
         
         # Get surface coordinates
-        x_surface = dev_data[0]['x_surface']
-        y_surface = dev_data[0]['y_surface']
+        x_surface = float(dev_data[0]['x_surface'])
+        y_surface = float(dev_data[0]['y_surface'])
         
         # Compute IL/XL from surface UTM
-        il, xl = utm_to_ilxl(x_surface, y_surface, Ox, Oy, a, b, c, d)
+        il, xl = utm_to_ilxl_batch([x_surface, y_surface], origin, M_inv)
         
         # Get depth range
-        max_tvdss = max(p['tvdss'] for p in dev_data)
+        max_tvdss = float(dev_data['tvdss'].max())
         
         # Build trajectory points (simplified - use surface + deviation offsets)
-        trajectory = []
-        for pt in dev_data:
-            pt_il, pt_xl = utm_to_ilxl(pt['x'], pt['y'], Ox, Oy, a, b, c, d)
-            trajectory.append({
-                'md': round(pt['ah_depth'], 1),
-                'tvdss': round(pt['tvdss'], 1),
-                'il': round(pt_il, 2),
-                'xl': round(pt_xl, 2),
-            })
+        trajectory = np.zeros(len(dev_data), dtype=TRAJECTORY_DTYPE)
+        trajectory['md'] = np.round(dev_data['ah_depth'], 1)
+        trajectory['tvdss'] = np.round(dev_data['tvdss'], 1)
+        traj_ilxl = wells_ilxl[nlog_name]
+        trajectory['il'] = np.round(traj_ilxl[:, 0], 2)
+        trajectory['xl'] = np.round(traj_ilxl[:, 1], 2)
         
-        # Build formation tops
-        tops = []
-        for fm in strat_data:
-            # Only include the main wellbore data (skip sidetracks)
-            tops.append({
-                'name': fm['name'],
-                'code': fm['code'],
-                'top_md': round(fm['top_md'], 1),
-                'top_tvdss': round(fm['top_tvdss'], 1),
-                'bottom_md': round(fm['bottom_md'], 1),
-                'bottom_tvdss': round(fm['bottom_tvdss'], 1),
-                'color': FORMATION_COLORS.get(fm['code'], '#999999'),
-            })
+        # Formation tops (records are already in output form, colors included)
+        tops = strat_data
         
         well_json = {
             'name': config['display_name'],
@@ -335,23 +567,22 @@ def main():
             'surface_xl': round(xl, 1),
             'surface_x_utm': x_surface,
             'surface_y_utm': y_surface,
-            'kb_elevation_m': round(-dev_data[0]['tvdss'] + dev_data[0]['ah_depth'], 1) if dev_data else 0,
-            'td_md': round(dev_data[-1]['ah_depth'], 1) if dev_data else 0,
+            'kb_elevation_m': round(float(dev_data[0]['ah_depth'] - dev_data[0]['tvdss']), 1) if len(dev_data) else 0,
+            'td_md': round(float(dev_data['ah_depth'][-1]), 1) if len(dev_data) else 0,
             'td_tvdss': round(max_tvdss, 1),
-            'trajectory': trajectory,
+            'trajectory': trajectory_to_json(trajectory),
             'formations': tops,
         }
         
         print(f"  {config['display_name']}: IL={il:.1f}, XL={xl:.1f}, "
-              f"TD={dev_data[-1]['ah_depth']:.0f}m, "
+              f"TD={dev_data['ah_depth'][-1]:.0f}m, "
               f"{len(trajectory)} trajectory pts, {len(tops)} formations")
         
         output['wells'].append(well_json)
     
     # Save JSON
     os.makedirs(os.path.dirname(OUTPUT_FILE), exist_ok=True)
-    with open(OUTPUT_FILE, 'w') as f:
-        json.dump(output, f, indent=2)
+    write_json(output, OUTPUT_FILE)
     
     print(f"\nSaved well data to {OUTPUT_FILE}")
     print(f"File size: {os.path.getsize(OUTPUT_FILE) / 1024:.1f} KB")
@@ -0,0 +1,119 @@
+"""
+Percentile clipping and normalization of seismic volumes, shared by
+convert_seismic.py and convert_to_bricks.py.
+
+Everything works one inline slab at a time, so memory-mapped volumes are
+streamed rather than loaded in full.
+"""
+
+import numpy as np
+from typing import Dict, List, Optional
+
+# Histogram resolution for each percentile refinement pass
+HIST_BINS = 65536
+
+# Voxels processed per slab when streaming over large (memory-mapped) volumes;
+# also the most values gathered in memory to select a percentile exactly
+SLAB_VOXELS = 1 << 24
+
+
+def inline_slabs(data: np.ndarray) -> List[slice]:
+    """Split axis 0 into slabs of roughly SLAB_VOXELS voxels each."""
+    step = max(1, SLAB_VOXELS // max(1, data[0].size))
+    return [slice(i, i + step) for i in range(0, data.shape[0], step)]
+
+
+def slab_percentiles(data: np.ndarray, percentiles, bins: int = HIST_BINS) -> np.ndarray:
+    """Compute percentiles like np.percentile (linear interpolation) slab by slab.
+    
+    Each order statistic needed is located with a histogram of only the
+    value range known to contain it, and that range is narrowed to the bin
+    holding it until few enough values remain to select exactly (or they
+    are all equal). Outliers therefore cannot squeeze the result into a
+    single bin. Each pass is linear in the data size; typical volumes need
+    three (min/max, one histogram, one gather), a large outlier adds one.
+    """
+    slabs = inline_slabs(data)
+    n = data.size
+    positions = np.asarray(percentiles, dtype=np.float64) / 100 * (n - 1)
+    lower = np.floor(positions).astype(np.int64)
+    upper = np.minimum(lower + 1, n - 1)
+    
+    data_min = min(float(data[s].min()) for s in slabs)
+    data_max = max(float(data[s].max()) for s in slabs)
+    
+    # Per wanted rank: (lo, hi) value range holding it, number of values
+    # below lo, number of values in [lo, hi]. Bounds are float64 so bin
+    # edges are computed in float64 whatever the data type.
+    pending = {int(k): (np.float64(data_min), np.float64(data_max), 0, n)
+               for k in np.union1d(lower, upper)}
+    found: Dict[int, float] = {}
+    while pending:
+        # One pass over the data serves every distinct range: gather the
+        # values of small ranges, histogram the others (tracking the actual
+        # min/max inside, which ends the search once only one value is left)
+        ranges = set(pending.values())
+        gathered = {r: [] for r in ranges if r[3] <= SLAB_VOXELS}
+        hists = {r: np.zeros(bins, dtype=np.int64) for r in ranges if r not in gathered}
+        extent = {r: [np.inf, -np.inf] for r in hists}
+        for s in slabs:
+            slab = data[s]
+            for r in ranges:
+                lo, hi = r[0], r[1]
+                inside = slab[(slab >= lo) & (slab <= hi)]
+                if r in gathered:
+                    gathered[r].append(inside)
+                elif inside.size:
+                    hists[r] += np.histogram(inside, bins=bins, range=(lo, hi))[0]
+                    extent[r][0] = min(extent[r][0], float(inside.min()))
+                    extent[r][1] = max(extent[r][1], float(inside.max()))
+    
+        for k, r in list(pending.items()):
+            lo, hi, below, count = r
+            rank = k - below
+            if r in gathered:
+                found[k] = float(np.partition(np.concatenate(gathered[r]), rank)[rank])
+                del pending[k]
+                continue
+            if extent[r][0] == extent[r][1]:
+                found[k] = extent[r][0]
+                del pending[k]
+                continue
+    
+            # Narrow to the bin holding the rank (bins are half-open except
+            # the last)
+            edges = np.histogram_bin_edges(np.empty(0), bins=bins, range=(lo, hi))
+            cdf = np.cumsum(hists[r])
+            j = int(np.searchsorted(cdf, rank, side='right'))
+            new_hi = hi if j == bins - 1 else np.nextafter(edges[j + 1], edges[j])
+            new_below = below + (int(cdf[j - 1]) if j > 0 else 0)
+            pending[k] = (edges[j], new_hi, new_below, int(hists[r][j]))
+    
+    frac = positions - lower
+    return np.array([found[lo] + f * (found[hi] - found[lo])
+                     for lo, hi, f in zip(lower.tolist(), upper.tolist(), frac)])
+
+
+def normalize_data(data: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """Normalize data to -1 to 1 range, optionally writing into a float32 `out`."""
+    # Use percentile clipping to handle outliers
+    p1, p99 = slab_percentiles(data, [1, 99])
+    normalized = np.empty(data.shape, dtype=np.float32) if out is None else out
+    
+    if p99 - p1 <= 0:
+        normalized.fill(0)
+        return normalized
+    
+    # Clip and rescale to -1, 1 one slab at a time, writing float32 output
+    # in place so each voxel is read once and no full-size temporaries exist.
+    # Scalars are float32 so the arithmetic never promotes to float64.
+    p1, p99 = np.float32(p1), np.float32(p99)
+    scale = np.float32(2 / (p99 - p1))
+    offset = np.float32(-1 - p1 * scale)
+    for s in inline_slabs(data):
+        slab = normalized[s]
+        np.clip(data[s], p1, p99, out=slab)
+        slab *= scale
+        slab += offset
+    
+    return normalized
@@ -31,6 +31,9 @@ export interface BrickManifest {
   levels: LevelInfo[];
   bricks: BrickInfo[];
   total_size_bytes: number;
+  dtype?: 'float32' | 'int16';  // Sample type of brick data (default: float32)
+  scale?: number;               // Multiplier from stored int16 to normalized value
+  compression?: string | null;  // Blosc2 codec of brick payloads (null: uncompressed)
 }
 
 interface LoadedBrick {
@@ -196,6 +199,15 @@ export class BrickManager {
    * Fetch brick data from server
    */
   private async fetchBrick(level: number, x: number, y: number, z: number): Promise<LoadedBrick> {
+    // Compressed bricks (convert_to_bricks.py --compression) cannot be
+    // decoded here; refuse them rather than reading the payload as samples
+    if (this.manifest?.compression) {
+      throw new Error(
+        `Bricks are ${this.manifest.compression}-compressed, which is not supported; ` +
+        'regenerate them without --compression'
+      );
+    }
+
     const filename = `level_${level}/brick_${x}_${y}_${z}.bin`;
     const response = await fetch(`${this.basePath}/${filename}`);
 
@@ -211,8 +223,18 @@ export class BrickManager {
     const actualSizeY = header.getInt32(4, true);
     const actualSizeZ = header.getInt32(8, true);
 
-    // Extract float data
-    const data = new Float32Array(buffer, 12);
+    // Extract float data, dequantizing int16 bricks
+    let data: Float32Array;
+    if (this.manifest?.dtype === 'int16') {
+      const quantized = new Int16Array(buffer, 12);
+      const scale = this.manifest.scale ?? 1 / 32767;
+      data = new Float32Array(quantized.length);
+      for (let i = 0; i < quantized.length; i++) {
+        data[i] = quantized[i] * scale;
+      }
+    } else {
+      data = new Float32Array(buffer, 12);
+    }
 
     return {
       data,